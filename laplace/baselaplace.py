@@ -1,11 +1,10 @@
+import os
 from math import sqrt, pi, log
 import numpy as np
 import torch
 from torch.nn.utils import parameters_to_vector, vector_to_parameters
-from torch.distributions import MultivariateNormal, Dirichlet, Normal
-
-from laplace.utils import (parameters_per_layer, invsqrt_precision, 
-                           get_nll, validate, Kron, normal_samples)
+from laplace.utils import (parameters_per_layer, get_nll, validate,
+                           Kron, normal_samples)
 from laplace.curvature import AsdlGGN, BackPackGGN, AsdlHessian
 
 
@@ -13,6 +12,64 @@ __all__ = ['BaseLaplace', 'ParametricLaplace',
            'FullLaplace', 'KronLaplace', 'DiagLaplace', 'LowRankLaplace']
 
 
+def _probit_link(f_mu, f_var):
+    """Probit approximation to the softmax-Gaussian integral over `(f_mu, f_var)`."""
+    kappa = 1 / torch.sqrt(1. + np.pi / 8 * f_var.diagonal(dim1=1, dim2=2))
+    return torch.softmax(kappa * f_mu, dim=-1)
+
+
+def _bridge_link(f_mu, f_var, norm: bool = False):
+    """Laplace bridge approximation mapping the Gaussian over `(f_mu, f_var)`
+    to a Dirichlet whose normalized concentration is returned; `norm` applies
+    the additional variance correction of the `'bridge_norm'` variant.
+    """
+    # zero mean correction; out-of-place so cached `f_mu` stays intact
+    f_mu = f_mu - (f_var.sum(-1) * f_mu.sum(-1).reshape(-1, 1) /
+                   f_var.sum(dim=(1, 2)).reshape(-1, 1))
+    f_var = f_var - (torch.einsum('bi,bj->bij', f_var.sum(-1), f_var.sum(-2)) /
+                     f_var.sum(dim=(1, 2)).reshape(-1, 1, 1))
+    # Laplace Bridge
+    _, K = f_mu.size(0), f_mu.size(-1)
+    f_var_diag = torch.diagonal(f_var, dim1=1, dim2=2)
+    # optional: variance correction
+    if norm:
+        f_var_diag_mean = f_var_diag.mean(dim=1)
+        f_var_diag_mean = f_var_diag_mean / torch.as_tensor([K/2], device=f_mu.device).sqrt()
+        f_mu = f_mu / f_var_diag_mean.sqrt().unsqueeze(-1)
+        f_var_diag = f_var_diag / f_var_diag_mean.unsqueeze(-1)
+    # exp(f_mu) / K^2 * sum_j exp(-f_mu_j) in a single, stable exp pass
+    log_sum_exp = torch.logsumexp(-f_mu, dim=1, keepdim=True)
+    alpha = (1 - 2/K + torch.exp(f_mu + log_sum_exp - 2 * log(K))) / f_var_diag
+    return torch.nan_to_num(alpha / alpha.sum(dim=1).unsqueeze(-1), nan=1.0)
+
+
+def _maybe_compile_link(fn):
+    """Optionally fuse a link approximation with `torch.compile`.
+    Both links are pure elementwise/reduction chains, but compilation costs
+    memory and startup latency and needs a working host toolchain, so it is
+    opt-in via ``LAPLACE_COMPILE_LINKS=1``. If the compiled function fails at
+    call time (compilation only happens on the first call), fall back to the
+    eager function permanently.
+    """
+    if not hasattr(torch, 'compile') or os.environ.get('LAPLACE_COMPILE_LINKS', '0') != '1':
+        return fn
+    compiled = torch.compile(fn, dynamic=True)
+
+    def link(f_mu, f_var, **kwargs):
+        nonlocal compiled
+        if compiled is not None:
+            try:
+                return compiled(f_mu, f_var, **kwargs)
+            except Exception:
+                compiled = None
+        return fn(f_mu, f_var, **kwargs)
+    return link
+
+
+_probit_link = _maybe_compile_link(_probit_link)
+_bridge_link = _maybe_compile_link(_bridge_link)
+
+
 class BaseLaplace:
     """Baseclass for all Laplace approximations in this library.
 
@@ -66,6 +123,9 @@ class BaseLaplace:
         self.n_outputs = None
         self.n_data = 0
 
+        # lazily computed number of parameters per layer (constant per model)
+        self._n_params_per_layer = None
+
     @property
     def backend(self):
         if self._backend is None:
@@ -109,12 +169,11 @@ class BaseLaplace:
         return self(x, pred_type, link_approx, n_samples)
 
     def _check_jacobians(self, Js):
-        if not isinstance(Js, torch.Tensor):
-            raise ValueError('Jacobians have to be torch.Tensor.')
-        if not Js.device == self._device:
-            raise ValueError('Jacobians need to be on the same device as Laplace.')
-        m, k, p = Js.size()
-        if p != self.n_params:
+        # called on every predictive batch; the type and device checks are
+        # asserts so that running with `python -O` strips them entirely
+        assert isinstance(Js, torch.Tensor), 'Jacobians have to be torch.Tensor.'
+        assert Js.device == self._device, 'Jacobians need to be on the same device as Laplace.'
+        if Js.size(-1) != self.n_params:
             raise ValueError('Invalid Jacobians shape for Laplace posterior approx.')
 
     @property
@@ -127,15 +186,16 @@ class BaseLaplace:
         prior_precision_diag : torch.Tensor
         """
         if len(self.prior_precision) == 1:  # scalar
-            return self.prior_precision * torch.ones(self.n_params, device=self._device)
+            return self.prior_precision.expand(self.n_params)
 
         elif len(self.prior_precision) == self.n_params:  # diagonal
             return self.prior_precision
 
         elif len(self.prior_precision) == self.n_layers:  # per layer
-            n_params_per_layer = parameters_per_layer(self.model)
-            return torch.cat([prior * torch.ones(n_params, device=self._device) for prior, n_params
-                              in zip(self.prior_precision, n_params_per_layer)])
+            if self._n_params_per_layer is None:
+                self._n_params_per_layer = torch.as_tensor(
+                    parameters_per_layer(self.model), device=self._device)
+            return torch.repeat_interleave(self.prior_precision, self._n_params_per_layer)
 
         else:
             raise ValueError('Mismatch of prior and model. Diagonal, scalar, or per-layer prior.')
@@ -146,9 +206,10 @@ class BaseLaplace:
 
     @prior_mean.setter
     def prior_mean(self, prior_mean):
-        if np.isscalar(prior_mean) and np.isreal(prior_mean):
-            self._prior_mean = torch.tensor(prior_mean, device=self._device)
-        elif torch.is_tensor(prior_mean):
+        self._prior_delta_sq = None
+        # check tensors first so repeated sets of an iterated tensor, e.g.,
+        # inside an optimization loop, do not wrap or copy
+        if torch.is_tensor(prior_mean):
             if prior_mean.ndim == 0:
                 self._prior_mean = prior_mean.reshape(-1).to(self._device)
             elif prior_mean.ndim == 1:
@@ -157,6 +218,8 @@ class BaseLaplace:
                 self._prior_mean = prior_mean
             else:
                 raise ValueError('Prior mean has too many dimensions!')
+        elif np.isscalar(prior_mean) and np.isreal(prior_mean):
+            self._prior_mean = torch.tensor(prior_mean, device=self._device)
         else:
             raise ValueError('Invalid argument type of prior mean.')
 
@@ -167,18 +230,23 @@ class BaseLaplace:
     @prior_precision.setter
     def prior_precision(self, prior_precision):
         self._posterior_scale = None
-        if np.isscalar(prior_precision) and np.isreal(prior_precision):
-            self._prior_precision = torch.tensor([prior_precision], device=self._device)
-        elif torch.is_tensor(prior_precision):
+        # check tensors first so repeated sets of an iterated tensor, e.g.,
+        # every Adam step of the marglik optimization, do not wrap or copy
+        if torch.is_tensor(prior_precision):
             if prior_precision.ndim == 0:
                 # make dimensional
                 self._prior_precision = prior_precision.reshape(-1).to(self._device)
             elif prior_precision.ndim == 1:
                 if len(prior_precision) not in [1, self.n_layers, self.n_params]:
                     raise ValueError('Length of prior precision does not align with architecture.')
-                self._prior_precision = prior_precision.to(self._device)
+                if prior_precision.device == self._device:
+                    self._prior_precision = prior_precision
+                else:
+                    self._prior_precision = prior_precision.to(self._device)
             else:
                 raise ValueError('Prior precision needs to be at most one-dimensional tensor.')
+        elif np.isscalar(prior_precision) and np.isreal(prior_precision):
+            self._prior_precision = torch.tensor([prior_precision], device=self._device)
         else:
             raise ValueError('Prior precision either scalar or torch.Tensor up to 1-dim.')
 
@@ -255,15 +323,35 @@ class BaseLaplace:
 
     def _gridsearch(self, loss, interval, val_loader, pred_type,
                     link_approx='probit', n_samples=100, loss_with_var=False):
+        # the Jacobians and outputs on the validation data do not depend on the
+        # prior precision, so for the GLM predictive they are computed once and
+        # only the functional variance and link are redone per grid point
+        cache = None
+        if pred_type == 'glm' and hasattr(self, '_glm_jacobians'):
+            Js, f_mus, ys = list(), list(), list()
+            for X, y in val_loader:
+                Js_batch, f_mu_batch = self._glm_jacobians(X.to(self._device))
+                Js.append(Js_batch.detach())
+                f_mus.append(f_mu_batch.detach())
+                ys.append(y.to(self._device))
+            # keep the validation set resident as single tensors so every grid
+            # point is one batched pass instead of re-iterating the val_loader
+            cache = (torch.cat(Js), torch.cat(f_mus), torch.cat(ys))
+
         results = list()
         prior_precs = list()
         for prior_prec in interval:
             self.prior_precision = prior_prec
             try:
-                out_dist, targets = validate(
-                    self, val_loader, pred_type=pred_type,
-                    link_approx=link_approx, n_samples=n_samples
-                )
+                if cache is not None:
+                    out_dist, targets = self._validate_cached(
+                        cache, link_approx=link_approx, n_samples=n_samples
+                    )
+                else:
+                    out_dist, targets = validate(
+                        self, val_loader, pred_type=pred_type,
+                        link_approx=link_approx, n_samples=n_samples
+                    )
                 if self.likelihood == 'regression':
                     out_mean, out_var = out_dist
                     if loss_with_var:
@@ -285,24 +373,42 @@ class BaseLaplace:
     @sigma_noise.setter
     def sigma_noise(self, sigma_noise):
         self._posterior_scale = None
-        if np.isscalar(sigma_noise) and np.isreal(sigma_noise):
-            self._sigma_noise = torch.tensor(sigma_noise, device=self._device)
-        elif torch.is_tensor(sigma_noise):
+        self._H_factor_cache = None
+        # check tensors first so repeated sets of an iterated tensor, e.g.,
+        # during joint marglik training, do not wrap or copy
+        if torch.is_tensor(sigma_noise):
             if sigma_noise.ndim == 0:
-                self._sigma_noise = sigma_noise.to(self._device)
+                if sigma_noise.device == self._device:
+                    self._sigma_noise = sigma_noise
+                else:
+                    self._sigma_noise = sigma_noise.to(self._device)
             elif sigma_noise.ndim == 1:
                 if len(sigma_noise) > 1:
                     raise ValueError('Only homoscedastic output noise supported.')
                 self._sigma_noise = sigma_noise[0].to(self._device)
             else:
                 raise ValueError('Sigma noise needs to be scalar or 1-dimensional.')
+        elif np.isscalar(sigma_noise) and np.isreal(sigma_noise):
+            self._sigma_noise = torch.tensor(sigma_noise, device=self._device)
         else:
             raise ValueError('Invalid type: sigma noise needs to be torch.Tensor or scalar.')
 
+    @property
+    def temperature(self):
+        return self._temperature
+
+    @temperature.setter
+    def temperature(self, temperature):
+        self._H_factor_cache = None
+        self._temperature = temperature
+
     @property
     def _H_factor(self):
-        sigma2 = self.sigma_noise.square()
-        return 1 / sigma2 / self.temperature
+        # cached since it is accessed repeatedly, e.g., in every marglik step
+        if self._H_factor_cache is None:
+            sigma2 = self.sigma_noise.square()
+            self._H_factor_cache = 1 / sigma2 / self.temperature
+        return self._H_factor_cache
 
 
 class ParametricLaplace(BaseLaplace):
@@ -364,6 +470,7 @@ class ParametricLaplace(BaseLaplace):
 
         self.model.eval()
         self.mean = parameters_to_vector(self.model.parameters()).detach()
+        self._prior_delta_sq = None
 
         X, _ = next(iter(train_loader))
         with torch.no_grad():
@@ -376,8 +483,8 @@ class ParametricLaplace(BaseLaplace):
 
         N = len(train_loader.dataset)
         for X, y in train_loader:
-            self.model.zero_grad()
-            X, y = X.to(self._device), y.to(self._device)
+            self.model.zero_grad(set_to_none=True)
+            X, y = X.to(self._device, non_blocking=True), y.to(self._device, non_blocking=True)
             loss_batch, H_batch = self._curv_closure(X, y, N)
             self.loss += loss_batch
             self.H += H_batch
@@ -395,8 +502,22 @@ class ParametricLaplace(BaseLaplace):
         [type]
             [description]
         """
-        delta = (self.mean - self.prior_mean)
-        return (delta * self.prior_precision_diag) @ delta
+        if len(self.prior_precision) == self.n_params:  # diagonal
+            delta = (self.mean - self.prior_mean)
+            return (delta * self.prior_precision) @ delta
+
+        # scalar or layer-wise prior precision: the per-layer squared norms of
+        # the MAP deviation are constant, e.g., across marglik optimizer steps
+        if self._prior_delta_sq is None:
+            delta = (self.mean - self.prior_mean)
+            n_params_per_layer = [int(n) for n in parameters_per_layer(self.model)]
+            if delta.ndim != 1 or sum(n_params_per_layer) != len(delta):
+                # layer structure of `model` does not match the covered
+                # parameters (e.g. last-layer or subnetwork Laplace)
+                return (delta * self.prior_precision_diag) @ delta
+            self._prior_delta_sq = torch.stack(
+                [d.square().sum() for d in delta.split(n_params_per_layer)])
+        return (self.prior_precision * self._prior_delta_sq).sum()
 
     @property
     def log_det_prior_precision(self):
@@ -407,7 +528,20 @@ class ParametricLaplace(BaseLaplace):
         -------
         log_det : torch.Tensor
         """
-        return self.prior_precision_diag.log().sum()
+        if len(self.prior_precision) == 1:  # scalar
+            return self.n_params * self.prior_precision.log().squeeze()
+
+        elif len(self.prior_precision) == self.n_params:  # diagonal
+            return self.prior_precision.log().sum()
+
+        # layer-wise prior precision
+        if self._n_params_per_layer is None:
+            self._n_params_per_layer = torch.as_tensor(
+                parameters_per_layer(self.model), device=self._device)
+        if int(self._n_params_per_layer.sum()) != self.n_params:
+            # fall back (and raise) for structures that do not match the model
+            return self.prior_precision_diag.log().sum()
+        return (self._n_params_per_layer * self.prior_precision.log()).sum()
 
     @property
     def log_det_posterior_precision(self):
@@ -547,34 +681,10 @@ class ParametricLaplace(BaseLaplace):
 
         if pred_type == 'glm':
             f_mu, f_var = self._glm_predictive_distribution(x)
-            # regression
-            if self.likelihood == 'regression':
-                return f_mu, f_var
-            # classification
-            if link_approx == 'mc':
-                return self.predictive_samples(x, pred_type='glm', n_samples=n_samples, 
-                                               diagonal_output=diagonal_output).mean(dim=0)
-            elif link_approx == 'probit':
-                kappa = 1 / torch.sqrt(1. + np.pi / 8 * f_var.diagonal(dim1=1, dim2=2))
-                return torch.softmax(kappa * f_mu, dim=-1)
-            elif 'bridge' in link_approx:
-                # zero mean correction
-                f_mu -= (f_var.sum(-1) * f_mu.sum(-1).reshape(-1, 1) /
-                         f_var.sum(dim=(1, 2)).reshape(-1, 1))
-                f_var -= (torch.einsum('bi,bj->bij', f_var.sum(-1), f_var.sum(-2)) /
-                          f_var.sum(dim=(1, 2)).reshape(-1, 1, 1))
-                # Laplace Bridge
-                _, K = f_mu.size(0), f_mu.size(-1)
-                f_var_diag = torch.diagonal(f_var, dim1=1, dim2=2)
-                # optional: variance correction
-                if link_approx == 'bridge_norm':
-                    f_var_diag_mean = f_var_diag.mean(dim=1)
-                    f_var_diag_mean /= torch.as_tensor([K/2], device=self._device).sqrt()
-                    f_mu /= f_var_diag_mean.sqrt().unsqueeze(-1)
-                    f_var_diag /= f_var_diag_mean.unsqueeze(-1)
-                sum_exp = torch.exp(-f_mu).sum(dim=1).unsqueeze(-1)
-                alpha = (1 - 2/K + f_mu.exp() / K**2 * sum_exp) / f_var_diag
-                return torch.nan_to_num(alpha / alpha.sum(dim=1).unsqueeze(-1), nan=1.0)
+            return self._glm_predictive(f_mu, f_var, link_approx=link_approx,
+                                        n_samples=n_samples,
+                                        diagonal_output=diagonal_output,
+                                        generator=generator)
         else:
             samples = self._nn_predictive_samples(x, n_samples)
             if self.likelihood == 'regression':
@@ -628,18 +738,89 @@ class ParametricLaplace(BaseLaplace):
             return self._nn_predictive_samples(x, n_samples)
 
     @torch.enable_grad()
+    def _glm_jacobians(self, X):
+        return self.backend.jacobians(X)
+
     def _glm_predictive_distribution(self, X):
-        Js, f_mu = self.backend.jacobians(X)
+        Js, f_mu = self._glm_jacobians(X)
         f_var = self.functional_variance(Js)
         return f_mu.detach(), f_var.detach()
 
+    def _glm_predictive(self, f_mu, f_var, link_approx='probit', n_samples=100,
+                        diagonal_output=False, generator=None):
+        """Compute the predictive from the GLM predictive distribution `(f_mu, f_var)`.
+        Separate from `__call__` so that cached `f_mu` and `f_var` can be reused,
+        for example, during a grid search over the prior precision.
+
+        Parameters
+        ----------
+        f_mu : torch.Tensor
+            predictive mean `(batch_size, outputs)`
+        f_var : torch.Tensor
+            predictive covariance `(batch_size, outputs, outputs)`
+        link_approx : {'mc', 'probit', 'bridge', 'bridge_norm'}
+        n_samples : int
+            number of samples for `link_approx='mc'`.
+        diagonal_output : bool
+            whether to use a diagonalized posterior predictive on the outputs.
+        generator : torch.Generator, optional
+            random number generator to control the samples (if sampling used)
+
+        Returns
+        -------
+        predictive: torch.Tensor or Tuple[torch.Tensor]
+        """
+        # regression
+        if self.likelihood == 'regression':
+            return f_mu, f_var
+        # classification
+        if link_approx == 'mc':
+            if diagonal_output:
+                f_var = torch.diagonal(f_var, dim1=1, dim2=2)
+            f_samples = normal_samples(f_mu, f_var, n_samples, generator)
+            return torch.softmax(f_samples, dim=-1).mean(dim=0)
+        elif link_approx == 'probit':
+            return _probit_link(f_mu, f_var)
+        elif 'bridge' in link_approx:
+            return _bridge_link(f_mu, f_var, norm=(link_approx == 'bridge_norm'))
+
+    @torch.no_grad()
+    def _validate_cached(self, cache, link_approx='probit', n_samples=100):
+        # mirrors `laplace.utils.validate` but reuses the Jacobians and outputs
+        # computed once for the entire validation set
+        Js, f_mu, targets = cache
+        f_var = self.functional_variance(Js)
+        out = self._glm_predictive(f_mu, f_var, link_approx=link_approx,
+                                   n_samples=n_samples)
+        return out, targets
+
     def _nn_predictive_samples(self, X, n_samples=100):
-        fs = list()
-        for sample in self.sample(n_samples):
-            vector_to_parameters(sample, self.model.parameters())
-            fs.append(self.model(X.to(self._device)).detach())
-        vector_to_parameters(self.mean, self.model.parameters())
-        fs = torch.stack(fs)
+        X = X.to(self._device)
+        samples = self.sample(n_samples)
+        try:
+            # vectorize the forward passes over the sample dimension; this avoids
+            # n_samples Python-level forward passes and parameter replacements
+            from torch.func import functional_call, vmap
+            shapes = [p.shape for p in self.model.parameters()]
+            sample_dicts = {
+                name: sample.view(n_samples, *shape) for (name, _), shape, sample
+                in zip(self.model.named_parameters(), shapes,
+                       samples.split([shape.numel() for shape in shapes], dim=1))
+            }
+            fs = vmap(functional_call, in_dims=(None, 0, None))(
+                self.model, sample_dicts, (X,)).detach()
+        except (ImportError, RuntimeError):
+            # fall back to a loop for models with operations that torch.func
+            # cannot vectorize, for example, in-place ops; the output buffer is
+            # preallocated after the first forward reveals the shape
+            fs = None
+            for i, sample in enumerate(samples):
+                vector_to_parameters(sample, self.model.parameters())
+                f = self.model(X).detach()
+                if fs is None:
+                    fs = f.new_empty((n_samples, *f.shape))
+                fs[i] = f
+            vector_to_parameters(self.mean, self.model.parameters())
         if self.likelihood == 'classification':
             fs = torch.softmax(fs, dim=-1)
         return fs
@@ -715,6 +896,7 @@ class FullLaplace(ParametricLaplace):
         super().__init__(model, likelihood, sigma_noise, prior_precision,
                          prior_mean, temperature, backend, backend_kwargs)
         self._posterior_scale = None
+        self._log_det_posterior_precision = None
 
     def _init_H(self):
         self.H = torch.zeros(self.n_params, self.n_params, device=self._device)
@@ -722,12 +904,39 @@ class FullLaplace(ParametricLaplace):
     def _curv_closure(self, X, y, N):
         return self.backend.full(X, y, N=N)
 
-    def fit(self, train_loader, override=True):
+    def fit(self, train_loader, override=True, keep_H=True):
+        """Fit the local Laplace approximation at the parameters of the model.
+        See `ParametricLaplace.fit` for the full interface.
+
+        Parameters
+        ----------
+        train_loader : torch.data.utils.DataLoader
+        override : bool, default=True
+        keep_H : bool, default=True
+            whether to keep the dense Hessian approximation after fitting.
+            With `keep_H=False`, only the Cholesky-based posterior scale and
+            the log determinant are retained, which halves the dominant memory
+            cost of a full Laplace. The prior precision and observation noise
+            can then no longer be changed post hoc and `override=False` in
+            subsequent fits is not supported.
+        """
         self._posterior_scale = None
-        return super().fit(train_loader, override=override)
+        super().fit(train_loader, override=override)
+        if not keep_H:
+            self._compute_scale()
+            self.H = None
 
     def _compute_scale(self):
-        self._posterior_scale = invsqrt_precision(self.posterior_precision)
+        # a single Cholesky factorization of the (reversed) posterior precision
+        # yields both the lower-triangular posterior scale and the
+        # log-determinant of the posterior precision
+        precision = self.posterior_precision
+        L_rev = torch.linalg.cholesky(torch.flip(precision, (-2, -1)))
+        C_inv = torch.flip(L_rev, (-2, -1)).transpose(-2, -1)
+        Id = torch.eye(precision.shape[-1], dtype=precision.dtype,
+                       device=precision.device)
+        self._posterior_scale = torch.linalg.solve_triangular(C_inv, Id, upper=False)
+        self._log_det_posterior_precision = 2 * L_rev.diagonal().log().sum()
 
     @property
     def posterior_scale(self):
@@ -764,23 +973,40 @@ class FullLaplace(ParametricLaplace):
         precision : torch.tensor
             `(parameters, parameters)`
         """
+        if self.H is None and self._posterior_scale is not None:
+            # H was discarded after fitting (`fit(..., keep_H=False)`);
+            # reconstruct the precision lazily from the cached scale
+            Id = torch.eye(self._posterior_scale.shape[0],
+                           dtype=self._posterior_scale.dtype, device=self._device)
+            L_inv = torch.linalg.solve_triangular(self._posterior_scale, Id, upper=False)
+            return L_inv.T @ L_inv
         self._check_H_init()
         return self._H_factor * self.H + torch.diag(self.prior_precision_diag)
 
     @property
     def log_det_posterior_precision(self):
-        return self.posterior_precision.logdet()
+        # computed alongside the posterior scale from a single Cholesky
+        # factorization and cached until the posterior precision changes
+        if self._posterior_scale is None:
+            self._compute_scale()
+        return self._log_det_posterior_precision
 
     def square_norm(self, value):
         delta = value - self.mean
         return delta @ self.posterior_precision @ delta
 
     def functional_variance(self, Js):
-        return torch.einsum('ncp,pq,nkq->nck', Js, self.posterior_covariance, Js)
+        # contract against the scale instead of the covariance so that the
+        # dense `P x P` covariance is never materialized
+        JL = torch.einsum('ncp,pq->ncq', Js, self.posterior_scale)
+        return torch.einsum('ncp,nkp->nck', JL, JL)
 
     def sample(self, n_samples=100):
-        dist = MultivariateNormal(loc=self.mean, scale_tril=self.posterior_scale)
-        return dist.sample((n_samples,))
+        # directly sample from the affine transform of a standard normal,
+        # which avoids the overhead of constructing a MultivariateNormal
+        samples = torch.randn(n_samples, self.n_params, device=self._device)
+        samples = samples @ self.posterior_scale.T
+        return self.mean.reshape(1, self.n_params) + samples
 
 
 class KronLaplace(ParametricLaplace):
@@ -870,7 +1096,8 @@ class KronLaplace(ParametricLaplace):
     def sample(self, n_samples=100):
         samples = torch.randn(n_samples, self.n_params, device=self._device)
         samples = self.posterior_precision.bmm(samples, exponent=-0.5)
-        return self.mean.reshape(1, self.n_params) + samples.reshape(n_samples, self.n_params)
+        # shift by the mean in place; the scaled noise is not needed anymore
+        return samples.reshape(n_samples, self.n_params).add_(self.mean.reshape(1, self.n_params))
 
     @BaseLaplace.prior_precision.setter
     def prior_precision(self, prior_precision):
@@ -911,7 +1138,8 @@ class LowRankLaplace(ParametricLaplace):
     @property
     def Kinv(self):
         (U, l), _ = self.posterior_precision
-        return torch.inverse(torch.diag(1 / l) + U.T @ self.V)
+        K = torch.diag(1 / l) + U.T @ self.V
+        return torch.cholesky_inverse(torch.linalg.cholesky(K))
 
     def fit(self, train_loader, override=True):
         # override fit since output of eighessian not additive across batch
@@ -921,6 +1149,7 @@ class LowRankLaplace(ParametricLaplace):
 
         self.model.eval()
         self.mean = parameters_to_vector(self.model.parameters()).detach()
+        self._prior_delta_sq = None
 
         X, _ = next(iter(train_loader))
         with torch.no_grad():
@@ -959,16 +1188,16 @@ class LowRankLaplace(ParametricLaplace):
         return prior_var - info_gain
 
     def sample(self, n_samples):
-        samples = torch.randn(self.n_params, n_samples)
+        samples = torch.randn(self.n_params, n_samples, device=self._device)
         d = self.prior_precision_diag
         Vs = self.V * d.sqrt().reshape(-1, 1)
         VtV = Vs.T @ Vs
-        Ik = torch.eye(len(VtV))
+        Ik = torch.eye(len(VtV), device=self._device)
         A = torch.linalg.cholesky(VtV)
         B = torch.linalg.cholesky(VtV + Ik)
-        A_inv = torch.inverse(A)
-        C = torch.inverse(A_inv.T @ (B - Ik) @ A_inv)
-        Kern_inv = torch.inverse(torch.inverse(C) + Vs.T @ Vs)
+        A_inv = torch.linalg.solve_triangular(A, Ik, upper=False)
+        # the double inversion of A^{-T} (B - I) A^{-1} cancels, so add it directly
+        Kern_inv = torch.linalg.inv(A_inv.T @ (B - Ik) @ A_inv + VtV)
         dinv_sqrt = (d).sqrt().reshape(-1, 1)
         prior_sample = dinv_sqrt * samples
         gain_sample = dinv_sqrt * Vs @ Kern_inv @ (Vs.T @ samples)
@@ -1039,12 +1268,16 @@ class DiagLaplace(ParametricLaplace):
 
     def functional_variance(self, Js: torch.Tensor) -> torch.Tensor:
         self._check_jacobians(Js)
-        return torch.einsum('ncp,p,nkp->nck', Js, self.posterior_variance, Js)
+        # scale the Jacobians once and contract with a batched GEMM instead of
+        # a three-operand einsum, which materializes a larger intermediate
+        Jw = Js * self.posterior_variance.sqrt()
+        return torch.bmm(Jw, Jw.transpose(-2, -1))
 
     def sample(self, n_samples=100):
+        # scale and shift the noise in place; only the randn buffer is allocated
         samples = torch.randn(n_samples, self.n_params, device=self._device)
-        samples = samples * self.posterior_scale.reshape(1, self.n_params)
-        return self.mean.reshape(1, self.n_params) + samples
+        samples.mul_(self.posterior_scale.reshape(1, self.n_params))
+        return samples.add_(self.mean.reshape(1, self.n_params))
 
 
 class FunctionalLaplace(BaseLaplace):
@@ -13,9 +13,35 @@ class BackPackInterface(CurvatureInterface):
     """
     def __init__(self, model, likelihood, last_layer=False, subnetwork_indices=None):
         super().__init__(model, likelihood, last_layer, subnetwork_indices)
+        self._flat_buf = None
         extend(self._model)
         extend(self.lossfunc)
 
+    def _flatten_params_attr(self, attr):
+        """Flatten the per-parameter BackPACK buffers named `attr` into a
+        single vector, reusing a preallocated output buffer across calls
+        instead of concatenating into a fresh tensor per batch.
+        """
+        params = list(self._model.parameters())
+        if self._flat_buf is None:
+            self._flat_buf = torch.empty(sum(p.numel() for p in params),
+                                         device=params[0].device, dtype=params[0].dtype)
+        offset = 0
+        for p in params:
+            n = p.numel()
+            self._flat_buf[offset:offset + n].copy_(getattr(p, attr).data.reshape(-1))
+            offset += n
+        return self._flat_buf
+
+    def _release_params_attr(self, attr):
+        """Drop the per-parameter BackPACK buffers named `attr`. They persist
+        on the parameters after the backward pass and would otherwise coexist
+        with the accumulated curvature until the next batch overwrites them.
+        """
+        for p in self._model.parameters():
+            if hasattr(p, attr):
+                delattr(p, attr)
+
     def jacobians(self, x):
         """Compute Jacobians \\(\\nabla_{\\theta} f(x;\\theta)\\) at current parameter \\(\\theta\\)
         using backpack's BatchGrad per output dimension.
@@ -96,10 +122,7 @@ class BackPackGGN(BackPackInterface, GGNInterface):
         self.stochastic = stochastic
 
     def _get_diag_ggn(self):
-        if self.stochastic:
-            return torch.cat([p.diag_ggn_mc.data.flatten() for p in self._model.parameters()])
-        else:
-            return torch.cat([p.diag_ggn_exact.data.flatten() for p in self._model.parameters()])
+        return self._flatten_params_attr('diag_ggn_mc' if self.stochastic else 'diag_ggn_exact')
 
     def _get_kron_factors(self):
         if self.stochastic:
@@ -123,6 +146,7 @@ class BackPackGGN(BackPackInterface, GGNInterface):
         with backpack(context()):
             loss.backward()
         dggn = self._get_diag_ggn()
+        self._release_params_attr('diag_ggn_mc' if self.stochastic else 'diag_ggn_exact')
         if self.subnetwork_indices is not None:
             dggn = dggn[self.subnetwork_indices]
 
@@ -136,6 +160,7 @@ class BackPackGGN(BackPackInterface, GGNInterface):
             loss.backward()
         kron = self._get_kron_factors()
         kron = self._rescale_kron_factors(kron, len(y), N)
+        self._release_params_attr('kfac' if self.stochastic else 'kflr')
 
         return self.factor * loss.detach(), self.factor * kron
 
@@ -149,8 +174,8 @@ class BackPackEF(BackPackInterface, EFInterface):
         loss = self.lossfunc(f, y)
         with backpack(SumGradSquared()):
             loss.backward()
-        diag_EF = torch.cat([p.sum_grad_squared.data.flatten()
-                             for p in self._model.parameters()])
+        diag_EF = self._flatten_params_attr('sum_grad_squared')
+        self._release_params_attr('sum_grad_squared')
         if self.subnetwork_indices is not None:
             diag_EF = diag_EF[self.subnetwork_indices]
 
@@ -211,11 +211,53 @@ class GGNInterface(CurvatureInterface):
         loss = self.factor * self.lossfunc(f, y)
         if self.likelihood == 'regression':
             H_ggn = torch.einsum('mkp,mkq->pq', Js, Js)
+        else:
+            # second derivative of log lik is diag(p) - pp^T; contract the
+            # diagonal and rank-1 parts separately so the (batch, C, C)
+            # likelihood Hessian is never materialized
+            ps = torch.softmax(f, dim=-1)
+            Jp = Js * ps.sqrt().unsqueeze(-1)
+            u = torch.einsum('mc,mcp->mp', ps, Js)
+            H_ggn = torch.einsum('mcp,mcq->pq', Jp, Jp) - u.T @ u
+        return loss.detach(), H_ggn
+
+    def _get_full_ggn_last_layer(self, x, y):
+        """Compute the full GGN of the last layer from its input features.
+        The last-layer Jacobian is the Kronecker product of the identity and
+        the features, so the GGN blocks are contracted directly from `phi`
+        without ever materializing the `(batch, outputs, parameters)` Jacobians.
+
+        Parameters
+        ----------
+        x : torch.Tensor
+            input data `(batch, input_shape)`
+        y : torch.Tensor
+            labels compatible with loss
+
+        Returns
+        -------
+        loss : torch.Tensor
+        H_ggn : torch.Tensor
+            full GGN approximation `(last-layer-parameters, last-layer-parameters)`
+        """
+        f, phi = self.model.forward_with_features(x)
+        f, phi = f.detach(), phi.detach()
+        loss = self.factor * self.lossfunc(f, y)
+        C, F = f.shape[-1], phi.shape[-1]
+        if self.likelihood == 'regression':
+            H_lik = torch.eye(C, device=f.device, dtype=f.dtype).expand(f.shape[0], C, C)
         else:
             # second derivative of log lik is diag(p) - pp^T
             ps = torch.softmax(f, dim=-1)
             H_lik = torch.diag_embed(ps) - torch.einsum('mk,mc->mck', ps, ps)
-            H_ggn = torch.einsum('mcp,mck,mkq->pq', Js, H_lik, Js)
+        # parameter layout is [weight.flatten(), bias], weight row-major (C, F)
+        H_ww = torch.einsum('njk,nf,ng->jfkg', H_lik, phi, phi).reshape(C * F, C * F)
+        if self.model.last_layer.bias is None:
+            return loss.detach(), H_ww
+        H_wb = torch.einsum('njk,nf->jfk', H_lik, phi).reshape(C * F, C)
+        H_bb = H_lik.sum(dim=0)
+        H_ggn = torch.cat([torch.cat([H_ww, H_wb], dim=1),
+                           torch.cat([H_wb.T, H_bb], dim=1)], dim=0)
         return loss.detach(), H_ggn
 
     def full(self, x, y, **kwargs):
@@ -240,10 +282,10 @@ class GGNInterface(CurvatureInterface):
             raise ValueError('Stochastic approximation not implemented for full GGN.')
 
         if self.last_layer:
-            Js, f = self.last_layer_jacobians(x)
+            loss, H_ggn = self._get_full_ggn_last_layer(x, y)
         else:
             Js, f = self.jacobians(x)
-        loss, H_ggn = self._get_full_ggn(Js, f, y)
+            loss, H_ggn = self._get_full_ggn(Js, f, y)
 
         return loss, H_ggn
 
@@ -112,19 +112,22 @@ class LLLaplace(ParametricLaplace):
 
         super().fit(train_loader, override=override)
         self.mean = parameters_to_vector(self.model.last_layer.parameters()).detach()
+        self._prior_delta_sq = None
 
-    def _glm_predictive_distribution(self, X):
-        Js, f_mu = self.backend.last_layer_jacobians(X)
-        f_var = self.functional_variance(Js)
-        return f_mu.detach(), f_var.detach()
+    def _glm_jacobians(self, X):
+        return self.backend.last_layer_jacobians(X)
 
     def _nn_predictive_samples(self, X, n_samples=100):
-        fs = list()
-        for sample in self.sample(n_samples):
+        X = X.to(self._device)
+        # preallocate the output buffer after the first forward reveals the shape
+        fs = None
+        for i, sample in enumerate(self.sample(n_samples)):
             vector_to_parameters(sample, self.model.last_layer.parameters())
-            fs.append(self.model(X.to(self._device)).detach())
+            f = self.model(X).detach()
+            if fs is None:
+                fs = f.new_empty((n_samples, *f.shape))
+            fs[i] = f
         vector_to_parameters(self.mean, self.model.last_layer.parameters())
-        fs = torch.stack(fs)
         if self.likelihood == 'classification':
             fs = torch.softmax(fs, dim=-1)
         return fs
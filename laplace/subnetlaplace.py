@@ -1,5 +1,4 @@
 import torch
-from torch.distributions import MultivariateNormal
 
 from laplace.baselaplace import ParametricLaplace, FullLaplace, DiagLaplace
 
@@ -111,6 +110,19 @@ class SubnetLaplace(ParametricLaplace):
         else:
             raise ValueError('Mismatch of prior and model. Diagonal or scalar prior.')
     
+    @property
+    def log_det_prior_precision(self):
+        """Compute log determinant of the prior precision
+        \\(\\log \\det P_0\\) over the subnetwork parameters only.
+
+        Returns
+        -------
+        log_det : torch.Tensor
+        """
+        if len(self.prior_precision) == 1:  # scalar
+            return self.n_params_subnet * self.prior_precision.log().squeeze()
+        return self.prior_precision_diag.log().sum()
+
     @property
     def mean_subnet(self):
         return self.mean[self.backend.subnetwork_indices]
@@ -141,8 +153,9 @@ class FullSubnetLaplace(SubnetLaplace, FullLaplace):
 
     def sample(self, n_samples=100):
         # sample only subnetwork parameters and set all other parameters to their MAP estimates
-        dist = MultivariateNormal(loc=self.mean_subnet, scale_tril=self.posterior_scale)
-        subnet_samples = dist.sample((n_samples,))
+        samples = torch.randn(n_samples, self.n_params_subnet, device=self._device)
+        samples = samples @ self.posterior_scale.T
+        subnet_samples = self.mean_subnet.reshape(1, self.n_params_subnet) + samples
         return self.assemble_full_samples(subnet_samples)
 
 
@@ -159,12 +172,11 @@ class DiagSubnetLaplace(SubnetLaplace, DiagLaplace):
         self.H = torch.zeros(self.n_params_subnet, device=self._device)
 
     def _check_jacobians(self, Js):
-        if not isinstance(Js, torch.Tensor):
-            raise ValueError('Jacobians have to be torch.Tensor.')
-        if not Js.device == self._device:
-            raise ValueError('Jacobians need to be on the same device as Laplace.')
-        m, k, p = Js.size()
-        if p != self.n_params_subnet:
+        # called on every predictive batch; the type and device checks are
+        # asserts so that running with `python -O` strips them entirely
+        assert isinstance(Js, torch.Tensor), 'Jacobians have to be torch.Tensor.'
+        assert Js.device == self._device, 'Jacobians need to be on the same device as Laplace.'
+        if Js.size(-1) != self.n_params_subnet:
             raise ValueError('Invalid Jacobians shape for Laplace posterior approx.')
 
     def sample(self, n_samples=100):
@@ -75,6 +75,26 @@ class Kron:
                  for Fi, Fj in zip(self.kfacs, other.kfacs)]
         return Kron(kfacs)
 
+    def __iadd__(self, other):
+        """Add up Kronecker factors `other` into `self` in place, reusing
+        the factor buffers of `self` instead of allocating new ones.
+
+        Parameters
+        ----------
+        other : Kron
+
+        Returns
+        -------
+        kron : Kron
+        """
+        if not isinstance(other, Kron):
+            raise ValueError('Can only add Kron to Kron.')
+
+        for Fi, Fj in zip(self.kfacs, other.kfacs):
+            for Hi, Hj in zip(Fi, Fj):
+                Hi.add_(Hj)
+        return self
+
     def __mul__(self, scalar: Union[float, torch.Tensor]):
         """Multiply all Kronecker factors by scalar.
         The multiplication is distributed across the number of factors
@@ -352,33 +372,25 @@ class KronDecomposed:
                 raise ValueError('Too many Kronecker factors. Something went wrong.')
         return logdet
 
-    def _bmm(self, W: torch.Tensor, exponent: float = -1) -> torch.Tensor:
-        """Implementation of `bmm`, i.e., `self ** exponent @ W`.
+    def _bmm_blocks(self, W: torch.Tensor, exponent: float = -1):
+        """Per-block computation of `self ** exponent @ W` along the parameter
+        dimension. Yields a tuple `(W_p, SW_p)` of input and result restricted
+        to each group of Kronecker factors; both of shape `(rows, params_block)`.
 
         Parameters
         ----------
         W : torch.Tensor
-            matrix `(batch, classes, params)`
+            matrix `(rows, params)`
         exponent : float
             exponent on `self`
-
-        Returns
-        -------
-        SW : torch.Tensor
-            result `(batch, classes, params)`
         """
-        # self @ W[batch, k, params]
-        assert len(W.size()) == 3
-        B, K, P = W.size()
-        W = W.reshape(B * K, P)
         cur_p = 0
-        SW = list()
         for ls, Qs, delta in zip(self.eigenvalues, self.eigenvectors, self.deltas):
             if len(ls) == 1:
                 Q, l, p = Qs[0], ls[0], len(ls[0])
                 ldelta_exp = torch.pow(l + delta, exponent).reshape(-1, 1)
-                W_p = W[:, cur_p:cur_p+p].T
-                SW.append((Q @ (ldelta_exp * (Q.T @ W_p))).T)
+                W_p = W[:, cur_p:cur_p+p]
+                yield W_p, (Q @ (ldelta_exp * (Q.T @ W_p.T))).T
                 cur_p += p
             elif len(ls) == 2:
                 Q1, Q2 = Qs
@@ -390,20 +402,59 @@ class KronDecomposed:
                 else:
                     ldelta_exp = torch.pow(torch.ger(l1, l2) + delta, exponent).unsqueeze(0)
                 p_in, p_out = len(l1), len(l2)
-                W_p = W[:, cur_p:cur_p+p].reshape(B * K, p_in, p_out)
-                W_p = (Q1.T @ W_p @ Q2) * ldelta_exp
-                W_p = Q1 @ W_p @ Q2.T
-                SW.append(W_p.reshape(B * K, p_in * p_out))
+                W_p = W[:, cur_p:cur_p+p]
+                SW_p = (Q1.T @ W_p.reshape(-1, p_in, p_out) @ Q2) * ldelta_exp
+                SW_p = (Q1 @ SW_p @ Q2.T).reshape(-1, p_in * p_out)
+                yield W_p, SW_p
                 cur_p += p
             else:
                 raise AttributeError('Shape mismatch')
-        SW = torch.cat(SW, dim=1).reshape(B, K, P)
-        return SW
+
+    def _bmm(self, W: torch.Tensor, exponent: float = -1) -> torch.Tensor:
+        """Implementation of `bmm`, i.e., `self ** exponent @ W`.
+
+        Parameters
+        ----------
+        W : torch.Tensor
+            matrix `(batch, classes, params)`
+        exponent : float
+            exponent on `self`
+
+        Returns
+        -------
+        SW : torch.Tensor
+            result `(batch, classes, params)`
+        """
+        # self @ W[batch, k, params]
+        assert len(W.size()) == 3
+        B, K, P = W.size()
+        W = W.reshape(B * K, P)
+        SW = torch.cat([SW_p for _, SW_p in self._bmm_blocks(W, exponent)], dim=1)
+        return SW.reshape(B, K, P)
 
     def inv_square_form(self, W: torch.Tensor) -> torch.Tensor:
-        # W either Batch x K x params or Batch x params
-        SW = self._bmm(W, exponent=-1)
-        return torch.bmm(W, SW.transpose(1, 2))
+        """Compute the inverse square form `W H^{-1} W^T` by accumulating the
+        per-block contributions, so the full-width intermediate `H^{-1} W^T`
+        is never concatenated.
+
+        Parameters
+        ----------
+        W : torch.Tensor
+            matrix `(batch, classes, params)`
+
+        Returns
+        -------
+        SW : torch.Tensor
+            result `(batch, classes, classes)`
+        """
+        assert len(W.size()) == 3
+        B, K, P = W.size()
+        W = W.reshape(B * K, P)
+        f_var = W.new_zeros(B, K, K)
+        for W_p, SW_p in self._bmm_blocks(W, exponent=-1):
+            f_var += torch.einsum('bkp,blp->bkl', W_p.reshape(B, K, -1),
+                                  SW_p.reshape(B, K, -1))
+        return f_var
 
     def bmm(self, W: torch.Tensor, exponent: float = -1) -> torch.Tensor:
         """Batched matrix multiplication with the decomposed Kronecker factors.
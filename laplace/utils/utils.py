@@ -5,7 +5,6 @@ import torch
 import torch.nn.functional as F
 from torch.nn.utils import parameters_to_vector
 from torch.nn import BatchNorm1d, BatchNorm2d, BatchNorm3d
-from torch.distributions.multivariate_normal import _precision_to_scale_tril
 
 
 __all__ = ['get_nll', 'validate', 'parameters_per_layer', 'invsqrt_precision', 'kron',
@@ -67,7 +66,14 @@ def invsqrt_precision(M):
     -------
     M_invsqrt : torch.Tensor
     """
-    return _precision_to_scale_tril(M)
+    # Cholesky of the flipped matrix yields the *upper*-triangular factor of
+    # M after flipping back, so the scale below stays lower-triangular;
+    # plain cholesky so non-positive-definite input raises instead of
+    # silently producing NaNs
+    L_rev = torch.linalg.cholesky(torch.flip(M, (-2, -1)))
+    C_inv = torch.flip(L_rev, (-2, -1)).transpose(-2, -1)
+    Id = torch.eye(M.shape[-1], dtype=M.dtype, device=M.device)
+    return torch.linalg.solve_triangular(C_inv, Id, upper=False)
 
 
 def _is_batchnorm(module):
@@ -184,7 +190,7 @@ def block_diag(blocks):
     M : torch.Tensor
     """
     P = sum([b.shape[0] for b in blocks])
-    M = torch.zeros(P, P)
+    M = torch.zeros(P, P, device=blocks[0].device, dtype=blocks[0].dtype)
     p_cur = 0
     for block in blocks:
         p_block = block.shape[0]
@@ -245,7 +251,13 @@ def normal_samples(mean, var, n_samples, generator=None):
         return (mean.unsqueeze(-1) + scaled_samples).permute((2, 0, 1))
     elif mean.shape == var.shape[:2] and var.shape[-1] == mean.shape[1]:
         # full covariance
-        scale = torch.linalg.cholesky(var)
+        scale, info = torch.linalg.cholesky_ex(var)
+        if (info != 0).any():
+            # fall back to a diagonal Normal for the batch entries that are
+            # not positive definite instead of failing the entire batch
+            failed = info != 0
+            diag_var = torch.diagonal(var[failed], dim1=-2, dim2=-1).clamp(min=0)
+            scale[failed] = torch.diag_embed(diag_var.sqrt())
         scaled_samples = torch.matmul(scale, randn_samples.unsqueeze(0))  # expand batch dim
         return (mean.unsqueeze(-1) + scaled_samples).permute((2, 0, 1))
     else: